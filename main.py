@@ -7,20 +7,23 @@ Filename format: hostname_mac_username_datetime.jpg
 import sys
 import os
 import time
+import functools
+import atexit
 
 # ============================================================================
 # Critical: Catch ALL imports at the top level
 # ============================================================================
 
-def ultra_safe_import(module_name, fallback_value=None):
+@functools.lru_cache(maxsize=None)
+def _import_module_cached(module_name):
     """
-    Import with multiple fallback strategies
-    Returns: (module_or_value, success_flag)
+    Resolve a module once per process (successes only - lru_cache does not
+    memoize the ImportError, so a module installed later is still found)
+    Returns: module
     """
     # Strategy 1: Direct import
     try:
-        module = __import__(module_name)
-        return module, True
+        return __import__(module_name)
     except ImportError:
         pass
     
@@ -29,11 +32,31 @@ def ultra_safe_import(module_name, fallback_value=None):
         try:
             main_module, sub_module = module_name.split('.', 1)
             main = __import__(main_module)
-            module = getattr(main, sub_module)
-            return module, True
+            return getattr(main, sub_module)
         except:
             pass
     
+    raise ImportError(f"No module named '{module_name}'")
+
+
+def ultra_safe_import(module_name, fallback_value=None):
+    """
+    Import with multiple fallback strategies
+    Returns: (module_or_value, success_flag)
+    """
+    # Already imported: skip the import machinery entirely. Dotted names
+    # always take the import path so the result doesn't depend on whether
+    # the submodule happens to be imported yet.
+    if '.' not in module_name:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            return module, True
+    
+    try:
+        return _import_module_cached(module_name), True
+    except ImportError:
+        pass
+    
     # Strategy 3: Return fallback if provided
     if fallback_value is not None:
         return fallback_value, False
@@ -50,69 +73,118 @@ def ultra_safe_import(module_name, fallback_value=None):
 subprocess, subprocess_ok = ultra_safe_import('subprocess', None)
 argparse, argparse_ok = ultra_safe_import('argparse', None)
 
+# Standard modules for system info (should always succeed)
+try:
+    import socket
+except ImportError:
+    socket = None
+
+try:
+    import uuid
+except ImportError:
+    uuid = None
+
+try:
+    import getpass
+except ImportError:
+    getpass = None
+
+try:
+    from datetime import datetime
+except ImportError:
+    datetime = None
+
+# Characters replaced in hostname/username components -> '_'
+_NAME_TRANS = str.maketrans({' ': '_', '/': '_'})
+
+# Characters that are invalid in Windows/Linux filenames -> '_'
+_INVALID_FN_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*\n\r\t\0'})
+
 # ============================================================================
 # Module Installation Helper (Redesigned for safety)
 # ============================================================================
 
+def safe_run_command(command, timeout):
+    """
+    Run an external command and capture its output
+    Returns: subprocess.CompletedProcess
+    
+    Keep this call free of preexec_fn (and user/group/umask changes): on
+    Python 3.10+ that lets _posixsubprocess spawn via vfork() instead of a
+    full fork(), avoiding a copy of the parent's page tables (cv2 makes this
+    process large). posix_spawn is NOT used here, since CPython only takes
+    that path with close_fds=False, and run() defaults to close_fds=True.
+    """
+    return subprocess.run(
+        command,
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+
+
+def _pip_install_commands(pip_name):
+    """
+    Lazily yield pip install commands, most reliable first
+    Skips tools missing from PATH and interpreters that are sys.executable
+    """
+    # Probe availability up front so missing tools never cost a fork/exec
+    try:
+        importlib, _ = ultra_safe_import('importlib.util')
+        pip_importable = importlib.util.find_spec('pip') is not None
+    except Exception:
+        pip_importable = True  # Can't tell - let subprocess decide
+    
+    try:
+        shutil, _ = ultra_safe_import('shutil')
+        which = shutil.which
+    except Exception:
+        which = lambda tool: tool  # Can't tell - let subprocess decide
+    
+    if pip_importable:
+        yield [sys.executable, "-m", "pip", "install", pip_name]
+    
+    for tool in ("pip", "pip3"):
+        if which(tool) is not None:
+            yield [tool, "install", pip_name]
+    
+    current_python = os.path.realpath(sys.executable) if sys.executable else None
+    for interpreter in ("python", "python3"):
+        path = which(interpreter)
+        if path is None:
+            continue
+        # Same binary as sys.executable was already tried (or lacks pip)
+        if current_python and os.path.realpath(path) == current_python:
+            continue
+        yield [interpreter, "-m", "pip", "install", pip_name]
+
+
 def safe_install_module(module_name, pip_name=None):
     """
     Safely install a module with multiple fallback strategies
     Returns: (success, message)
     """
-    if subprocess is None:
+    if not subprocess_ok:
         return False, "subprocess module not available for installation"
     
     pip_name = pip_name or module_name
     
     print(f"Attempting to install {pip_name}...")
     
-    installation_methods = [
-        [sys.executable, "-m", "pip", "install", pip_name],
-        ["pip", "install", pip_name],
-        ["pip3", "install", pip_name],
-        ["python", "-m", "pip", "install", pip_name],
-        ["python3", "-m", "pip", "install", pip_name],
-    ]
-    
-    for method in installation_methods:
+    for method in _pip_install_commands(pip_name):
         try:
-            # Use Popen with timeout to prevent hanging
-            import signal
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Installation timed out")
-            
-            # Only set timeout if signal module is available
-            old_handler = None
-            if 'signal' in sys.modules:
-                signal_module = sys.modules['signal']
-                old_handler = signal_module.signal(signal_module.SIGALRM, timeout_handler)
-                signal_module.alarm(60)  # 60 second timeout
+            # subprocess.run's own timeout is the only watchdog we need
+            result = safe_run_command(method, timeout=120)
             
-            try:
-                # Run installation
-                result = subprocess.run(
-                    method,
-                    capture_output=True,
-                    text=True,
-                    timeout=120  # Additional timeout
-                )
+            if result.returncode == 0:
+                return True, f"Successfully installed {pip_name}"
+            else:
+                print(f"Installation failed with method {method[0]}: {result.stderr[:200]}")
                 
-                if result.returncode == 0:
-                    return True, f"Successfully installed {pip_name}"
-                else:
-                    print(f"Installation failed with method {method[0]}: {result.stderr[:200]}")
-                    
-            except subprocess.TimeoutExpired:
-                return False, f"Installation timed out for {pip_name}"
-            except FileNotFoundError:
-                continue  # Try next method
-            finally:
-                # Restore signal handler
-                if old_handler is not None and 'signal' in sys.modules:
-                    signal_module = sys.modules['signal']
-                    signal_module.alarm(0)
-                    signal_module.signal(signal_module.SIGALRM, old_handler)
-                    
+        except subprocess.TimeoutExpired:
+            return False, f"Installation timed out for {pip_name}"
+        except FileNotFoundError:
+            continue  # Try next method
         except Exception as e:
             print(f"Installation attempt failed: {e}")
             continue
@@ -124,98 +196,71 @@ def safe_install_module(module_name, pip_name=None):
 # Fallback Implementations
 # ============================================================================
 
+def _format_mac(mac_num):
+    """Format a 48-bit node number as xx-xx-xx-xx-xx-xx"""
+    mac_bytes = mac_num.to_bytes(6, 'big')
+    try:
+        return mac_bytes.hex('-')
+    except TypeError:
+        # bytes.hex() only accepts a separator on Python 3.8+
+        return '-'.join(f'{b:02x}' for b in mac_bytes)
+
+
 class SystemInfoFallback:
     """Fallback implementations for system information"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_hostname():
         """Get hostname with multiple fallbacks"""
         try:
-            import socket
             hostname = socket.gethostname()
             if hostname and hostname.strip():
-                return hostname.replace(' ', '_').replace('/', '_')[:50]
+                return hostname.translate(_NAME_TRANS)[:50]
         except:
             pass
         
-        # Try environment variables
-        env_hostname = os.environ.get('COMPUTERNAME') or \
-                      os.environ.get('HOSTNAME') or \
-                      os.environ.get('HOST')
-        
-        if env_hostname:
-            return env_hostname.replace(' ', '_')[:50]
+        # Try environment variables (first hit wins)
+        for var in ('COMPUTERNAME', 'HOSTNAME', 'HOST'):
+            env_hostname = os.environ.get(var)
+            if env_hostname:
+                return env_hostname.translate(_NAME_TRANS)[:50]
         
-        # Try reading from system files (Unix/Linux)
-        if os.path.exists('/etc/hostname'):
-            try:
-                with open('/etc/hostname', 'r') as f:
-                    hostname = f.read().strip()
-                    if hostname:
-                        return hostname.replace(' ', '_')[:50]
-            except:
-                pass
+        # Last resort: read from system files (Unix/Linux)
+        try:
+            with open('/etc/hostname', 'r') as f:
+                hostname = f.read().strip()
+                if hostname:
+                    return hostname.translate(_NAME_TRANS)[:50]
+        except:
+            pass
         
         return "unknown_host"
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_mac_address():
         """Get MAC address with multiple fallbacks"""
         try:
-            import uuid
             mac_num = uuid.getnode()
             # Check if it's a valid MAC (not all zeros or randomized)
             if mac_num >> 40 & 1:
                 return "unknown-mac"  # Randomized MAC
             
-            mac_hex = uuid.UUID(int=mac_num).hex[-12:]
-            if mac_hex == '000000000000' or all(c == '0' for c in mac_hex):
+            if mac_num == 0:
                 return "unknown-mac"
             
             # Format as XX-XX-XX-XX-XX-XX
-            return '-'.join(mac_hex[i:i+2] for i in range(0, 12, 2))
+            return _format_mac(mac_num)
         except:
             pass
         
         # Try network interfaces (platform-specific)
         try:
-            if sys.platform.startswith('win'):
-                import ctypes
-                import ctypes.wintypes
-                
-                class MIB_IFROW(ctypes.Structure):
-                    _fields_ = [
-                        ('wszName', ctypes.wintypes.WCHAR * 256),
-                        ('dwIndex', ctypes.wintypes.DWORD),
-                        ('dwType', ctypes.wintypes.DWORD),
-                        ('dwMtu', ctypes.wintypes.DWORD),
-                        ('dwSpeed', ctypes.wintypes.DWORD),
-                        ('dwPhysAddrLen', ctypes.wintypes.DWORD),
-                        ('bPhysAddr', ctypes.c_ubyte * 8),
-                        ('dwAdminStatus', ctypes.wintypes.DWORD),
-                        ('dwOperStatus', ctypes.wintypes.DWORD),
-                        ('dwLastChange', ctypes.wintypes.DWORD),
-                        ('dwInOctets', ctypes.wintypes.DWORD),
-                        ('dwInUcastPkts', ctypes.wintypes.DWORD),
-                        ('dwInNUcastPkts', ctypes.wintypes.DWORD),
-                        ('dwInDiscards', ctypes.wintypes.DWORD),
-                        ('dwInErrors', ctypes.wintypes.DWORD),
-                        ('dwInUnknownProtos', ctypes.wintypes.DWORD),
-                        ('dwOutOctets', ctypes.wintypes.DWORD),
-                        ('dwOutUcastPkts', ctypes.wintypes.DWORD),
-                        ('dwOutNUcastPkts', ctypes.wintypes.DWORD),
-                        ('dwOutDiscards', ctypes.wintypes.DWORD),
-                        ('dwOutErrors', ctypes.wintypes.DWORD),
-                        ('dwOutQLen', ctypes.wintypes.DWORD),
-                        ('dwDescrLen', ctypes.wintypes.DWORD),
-                        ('bDescr', ctypes.c_ubyte * 256)
-                    ]
-                
-                # Try to get MAC from Windows API
-                # (This is complex and may fail - that's OK, we have fallback)
-                pass
-                
-            elif sys.platform.startswith('linux'):
+            # No extra Windows fallback beyond uuid.getnode(); if one is added,
+            # use a single GetAdaptersAddresses call rather than marshalling
+            # full MIB_IFROW structures.
+            if sys.platform.startswith('linux'):
                 # Try reading from /sys/class/net/
                 for interface in ['eth0', 'wlan0', 'enp0s3', 'wlp2s0']:
                     mac_file = f'/sys/class/net/{interface}/address'
@@ -233,13 +278,13 @@ class SystemInfoFallback:
         return "unknown-mac"
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_username():
         """Get username with multiple fallbacks"""
         try:
-            import getpass
             username = getpass.getuser()
             if username and username.strip():
-                return username.replace(' ', '_').replace('/', '_')[:50]
+                return username.translate(_NAME_TRANS)[:50]
         except:
             pass
         
@@ -249,21 +294,18 @@ class SystemInfoFallback:
                   os.environ.get('LOGNAME')
         
         if env_user:
-            return env_user.replace(' ', '_')[:50]
+            return env_user.translate(_NAME_TRANS)[:50]
         
         # Try platform-specific methods
         if sys.platform.startswith('win'):
             # Windows: try whoami command
             try:
-                if subprocess:
-                    result = subprocess.run(['whoami'], 
-                                          capture_output=True, 
-                                          text=True, 
-                                          timeout=2)
+                if subprocess_ok:
+                    result = safe_run_command(['whoami'], timeout=2)
                     if result.returncode == 0:
                         username = result.stdout.strip().split('\\')[-1]
                         if username:
-                            return username.replace(' ', '_')[:50]
+                            return username.translate(_NAME_TRANS)[:50]
             except:
                 pass
         
@@ -275,10 +317,14 @@ class SystemInfoFallback:
 # ============================================================================
 
 class UltraRobustCameraCapture:
+    # (hostname, mac, username) resolved once per process
+    _system_info_cache = None
+    
     def __init__(self, output_dir="camshots"):
         """Initialize with maximum robustness"""
         self.output_dir = ""
         self.log_file = ""
+        self._log_fh = None
         self.hostname = "unknown_host"
         self.mac = "unknown-mac"
         self.username = "unknown_user"
@@ -304,6 +350,22 @@ class UltraRobustCameraCapture:
             print(f"⚠️  Partial initialization error (continuing anyway): {e}")
             # Even if initialization fails partially, we can still try to capture
     
+    @staticmethod
+    def _is_writable_dir(path):
+        """Check directory writability (real probe write on Windows)"""
+        if not sys.platform.startswith('win'):
+            return os.access(path, os.W_OK)
+        
+        # On Windows os.access ignores ACLs, so actually try a write
+        try:
+            test_file = os.path.join(path, '.write_test')
+            with open(test_file, 'w') as f:
+                f.write('test')
+            os.remove(test_file)
+            return True
+        except OSError:
+            return False
+    
     def _set_output_directory(self, requested_dir):
         """Set output directory with multiple fallbacks"""
         try:
@@ -311,10 +373,8 @@ class UltraRobustCameraCapture:
             if requested_dir:
                 os.makedirs(requested_dir, exist_ok=True)
                 # Test if directory is writable
-                test_file = os.path.join(requested_dir, '.write_test')
-                with open(test_file, 'w') as f:
-                    f.write('test')
-                os.remove(test_file)
+                if not self._is_writable_dir(requested_dir):
+                    raise OSError(f"Directory not writable: {requested_dir}")
                 self.output_dir = requested_dir
                 return
         except:
@@ -322,18 +382,16 @@ class UltraRobustCameraCapture:
         
         # Fallback 1: Current directory
         try:
+            if not self._is_writable_dir("."):
+                raise OSError("Current directory not writable")
             self.output_dir = "."
-            test_file = os.path.join(self.output_dir, '.write_test')
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.remove(test_file)
             return
         except:
             pass
         
         # Fallback 2: Temp directory
         try:
-            import tempfile
+            tempfile, _ = ultra_safe_import('tempfile')
             temp_dir = tempfile.gettempdir()
             self.output_dir = temp_dir
             print(f"⚠️  Using temp directory: {temp_dir}")
@@ -370,7 +428,7 @@ class UltraRobustCameraCapture:
                 print("✓ OpenCV initialized successfully")
                 break
             except ImportError:
-                if attempt == 0 and subprocess:
+                if attempt == 0 and subprocess_ok:
                     # Try to install on first attempt
                     success, msg = safe_install_module('opencv-python')
                     if not success:
@@ -385,39 +443,32 @@ class UltraRobustCameraCapture:
                     time.sleep(1)  # Wait before retry
                 continue
         
-        # Initialize standard modules (should always succeed)
-        standard_modules = [
-            ('socket', 'socket'),
-            ('uuid', 'uuid'),
-            ('getpass', 'getpass'),
-            ('datetime.datetime', 'datetime')
-        ]
+        # Standard modules were imported at module scope
+        self.socket = socket
+        self.uuid = uuid
+        self.getpass = getpass
+        self.datetime = datetime
         
-        for import_str, module_key in standard_modules:
-            try:
-                if '.' in import_str:
-                    parts = import_str.split('.')
-                    module = __import__(parts[0])
-                    for part in parts[1:]:
-                        module = getattr(module, part)
-                else:
-                    module = __import__(import_str)
-                
-                setattr(self, module_key, module)
+        for module_key in ('socket', 'uuid', 'getpass', 'datetime'):
+            if getattr(self, module_key) is not None:
                 self.modules_available[module_key] = True
-            except Exception as e:
-                print(f"⚠️  Module {module_key} not available: {e}")
-                setattr(self, module_key, None)
+            else:
+                print(f"⚠️  Module {module_key} not available")
     
     def _get_system_info_safe(self):
-        """Get system information safely"""
+        """Get system information safely (computed once per process)"""
+        cached = UltraRobustCameraCapture._system_info_cache
+        if cached is not None:
+            self.hostname, self.mac, self.username = cached
+            return
+        
         fallback = SystemInfoFallback()
         
         # Get hostname
         try:
             if self.modules_available.get('socket'):
                 self.hostname = self.socket.gethostname()
-                self.hostname = self.hostname.replace(' ', '_').replace('/', '_')[:50]
+                self.hostname = self.hostname.translate(_NAME_TRANS)[:50]
                 if not self.hostname or self.hostname.strip() == '':
                     self.hostname = fallback.get_hostname()
             else:
@@ -430,9 +481,8 @@ class UltraRobustCameraCapture:
             if self.modules_available.get('uuid'):
                 mac_num = self.uuid.getnode()
                 if not (mac_num >> 40 & 1):  # Not randomized
-                    mac_hex = self.uuid.UUID(int=mac_num).hex[-12:]
-                    if mac_hex != '000000000000':
-                        self.mac = '-'.join(mac_hex[i:i+2] for i in range(0, 12, 2))
+                    if mac_num != 0:
+                        self.mac = _format_mac(mac_num)
                     else:
                         self.mac = fallback.get_mac_address()
                 else:
@@ -446,36 +496,61 @@ class UltraRobustCameraCapture:
         try:
             if self.modules_available.get('getpass'):
                 self.username = self.getpass.getuser()
-                self.username = self.username.replace(' ', '_').replace('/', '_')[:50]
+                self.username = self.username.translate(_NAME_TRANS)[:50]
                 if not self.username or self.username.strip() == '':
                     self.username = fallback.get_username()
             else:
                 self.username = fallback.get_username()
         except:
             self.username = fallback.get_username()
+        
+        UltraRobustCameraCapture._system_info_cache = (self.hostname, self.mac, self.username)
     
     def _initialize_logging_safe(self):
         """Initialize logging safely"""
         try:
             self.log_file = os.path.join(self.output_dir, "capture_log.txt")
-            # Test if we can write to log file
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(f"Log initialized at {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            # Keep the log open (line-buffered) instead of reopening per event
+            self._log_fh = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+            atexit.register(self._log_fh.close)
+            self._log_fh.write(f"Log initialized at {self._log_timestamp()}\n")
         except Exception as e:
             print(f"⚠️  Cannot initialize logging: {e}")
+            self.close()
             self.log_file = None
     
+    def close(self):
+        """Close the log file handle (safe to call more than once)"""
+        log_fh, self._log_fh = self._log_fh, None
+        if log_fh is None:
+            return
+        try:
+            atexit.unregister(log_fh.close)
+            log_fh.close()
+        except:
+            pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+    
+    def _log_timestamp(self):
+        """Current time as 'YYYY-MM-DD HH:MM:SS' for log lines"""
+        return time.strftime("%Y-%m-%d %H:%M:%S")
+    
     def _log_event(self, message, level="INFO"):
         """Safe logging with multiple fallbacks"""
         try:
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = self._log_timestamp()
             log_entry = f"{timestamp} [{level}] {message}\n"
             
             # Try to write to log file
-            if self.log_file:
+            if self._log_fh is not None:
                 try:
-                    with open(self.log_file, 'a', encoding='utf-8') as f:
-                        f.write(log_entry)
+                    self._log_fh.write(log_entry)
                 except:
                     pass
             
@@ -493,8 +568,7 @@ class UltraRobustCameraCapture:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             try:
                 # Try to get milliseconds
-                import datetime
-                ms = datetime.datetime.now().microsecond // 1000
+                ms = self.datetime.now().microsecond // 1000
                 timestamp += f"_{ms:03d}"
             except:
                 timestamp += "_000"
@@ -516,9 +590,7 @@ class UltraRobustCameraCapture:
             filename = "_".join(components) + ".jpg"
             
             # Sanitize filename (critical for Windows/Linux compatibility)
-            invalid_chars = '<>:"/\\|?*\n\r\t\0'
-            for char in invalid_chars:
-                filename = filename.replace(char, '_')
+            filename = filename.translate(_INVALID_FN_TRANS)
             
             # Ensure filename length is safe
             if len(filename) > 200:
@@ -533,6 +605,37 @@ class UltraRobustCameraCapture:
             # Ultimate fallback
             return f"capture_{int(time.time())}.jpg"
     
+    def _candidate_camera_ids(self, max_cameras):
+        """Camera indices worth opening (skips missing devices on Linux)"""
+        if sys.platform.startswith('linux'):
+            return [i for i in range(max_cameras) if os.path.exists(f'/dev/video{i}')]
+        return list(range(max_cameras))
+    
+    def _camera_attempts(self, max_cameras, opened):
+        """
+        Yield (cam_id, backend) pairs to try, backend None meaning the default
+        On Windows a DirectShow-only pass runs first (fails fast on missing
+        indices); the default backend (MSMF) gets a second pass only if the
+        caller recorded nothing in `opened` during the first one.
+        """
+        backends = [None]
+        if sys.platform.startswith('win'):
+            dshow = getattr(self.cv2, 'CAP_DSHOW', None)
+            if dshow is not None:
+                backends.insert(0, dshow)
+        
+        for backend in backends:
+            if opened:
+                return
+            for cam_id in self._candidate_camera_ids(max_cameras):
+                yield cam_id, backend
+    
+    def _open_camera(self, cam_id, backend=None):
+        """Open a camera with the given backend (or OpenCV's default)"""
+        if backend is None:
+            return self.cv2.VideoCapture(cam_id)
+        return self.cv2.VideoCapture(cam_id, backend)
+    
     def capture(self):
         """Main capture method - will never crash"""
         self._log_event("Starting capture process", "INFO")
@@ -545,10 +648,12 @@ class UltraRobustCameraCapture:
         
         # Try to capture from cameras
         max_cameras = 5
-        cameras_tried = 0
+        cameras_tried = set()
         
-        for cam_id in range(max_cameras):
-            cameras_tried += 1
+        opened = []
+        
+        for cam_id, backend in self._camera_attempts(max_cameras, opened):
+            cameras_tried.add(cam_id)
             cap = None
             
             try:
@@ -556,7 +661,7 @@ class UltraRobustCameraCapture:
                 
                 # Open camera with timeout protection
                 start_time = time.time()
-                cap = self.cv2.VideoCapture(cam_id)
+                cap = self._open_camera(cam_id, backend)
                 
                 # Check if opened successfully
                 if not cap.isOpened():
@@ -564,41 +669,28 @@ class UltraRobustCameraCapture:
                     if cap:
                         cap.release()
                     continue
+                opened.append(cam_id)
                 
                 # Set timeouts for camera operations
                 cap.set(self.cv2.CAP_PROP_BUFFERSIZE, 1)
                 
-                # Test camera with timeout
-                test_success = False
-                for test_attempt in range(3):
-                    try:
-                        ret, frame = cap.read()
-                        if ret and frame is not None and frame.size > 0:
-                            test_success = True
-                            break
-                        time.sleep(0.1)
-                    except:
-                        time.sleep(0.1)
-                        continue
-                
-                if not test_success:
-                    self._log_event(f"Camera {cam_id} test failed", "DEBUG")
-                    cap.release()
-                    continue
-                
-                # Camera is working, capture final image
-                time.sleep(0.1)  # Brief pause
+                # Warm-up: discard the first frame (often black/underexposed/stale)
+                try:
+                    cap.grab()
+                except:
+                    pass
                 
+                # Grab a frame; only pause between attempts that failed
                 ret, frame = None, None
                 for capture_attempt in range(3):
                     try:
                         ret, frame = cap.read()
                         if ret and frame is not None and frame.size > 0:
                             break
-                        time.sleep(0.05)
                     except:
+                        pass
+                    if capture_attempt < 2:
                         time.sleep(0.05)
-                        continue
                 
                 if not ret or frame is None or frame.size == 0:
                     self._log_event(f"Camera {cam_id} capture failed", "DEBUG")
@@ -618,31 +710,32 @@ class UltraRobustCameraCapture:
                 # Save image with compression
                 try:
                     encode_param = [int(self.cv2.IMWRITE_JPEG_QUALITY), 85]
-                    success = self.cv2.imwrite(filepath, frame, encode_param)
+                    # Encode in memory, then write the bytes ourselves
+                    success, buf = self.cv2.imencode('.jpg', frame, encode_param)
                     
                     if success:
-                        # Verify file was saved
-                        if os.path.exists(filepath):
-                            file_size = os.path.getsize(filepath)
-                            if file_size > 100:  # At least 100 bytes
-                                self._log_event(f"SUCCESS: Captured {filename} ({file_size/1024:.1f} KB)", "SUCCESS")
-                                
-                                # Clean up and return
-                                cap.release()
-                                self.cv2.destroyAllWindows()
-                                
-                                # Final verification
-                                time.sleep(0.1)  # Let filesystem catch up
-                                if os.path.exists(filepath):
-                                    return True
-                                else:
-                                    self._log_event(f"WARNING: File disappeared after save: {filepath}", "WARNING")
-                            else:
-                                self._log_event(f"WARNING: File too small: {filepath} ({file_size} bytes)", "WARNING")
-                        else:
+                        with open(filepath, 'wb') as f:
+                            f.write(buf)  # ndarray buffer, no copy
+                        
+                        # Verify file was saved (one stat for existence + size)
+                        try:
+                            file_size = os.stat(filepath).st_size
+                        except FileNotFoundError:
+                            file_size = None
+                        
+                        if file_size is None:
                             self._log_event(f"ERROR: File not created: {filepath}", "ERROR")
+                        elif file_size > 100:  # At least 100 bytes
+                            self._log_event(f"SUCCESS: Captured {filename} ({file_size/1024:.1f} KB)", "SUCCESS")
+                            
+                            # Clean up and return
+                            cap.release()
+                            self.cv2.destroyAllWindows()
+                            return True
+                        else:
+                            self._log_event(f"WARNING: File too small: {filepath} ({file_size} bytes)", "WARNING")
                     else:
-                        self._log_event(f"ERROR: cv2.imwrite failed for {filepath}", "ERROR")
+                        self._log_event(f"ERROR: cv2.imencode failed for {filepath}", "ERROR")
                 
                 except self.cv2.error as e:
                     self._log_event(f"OpenCV write error: {e}", "ERROR")
@@ -667,7 +760,7 @@ class UltraRobustCameraCapture:
                     except:
                         pass
         
-        self._log_event(f"No cameras available (tried {cameras_tried} cameras)", "WARNING")
+        self._log_event(f"No cameras available (tried {len(cameras_tried)} cameras)", "WARNING")
         return False
 
 
@@ -698,19 +791,18 @@ def main():
         
         # Create capture instance
         print("\nInitializing...")
-        capture = UltraRobustCameraCapture(output_dir=output_dir)
-        
-        # Show system info
-        print(f"\nSystem Information:")
-        print(f"  Hostname: {capture.hostname}")
-        print(f"  MAC: {capture.mac}")
-        print(f"  User: {capture.username}")
-        print(f"  Output: {os.path.abspath(capture.output_dir)}")
-        
-        # Attempt capture
-        print("\n" + "=" * 60)
-        success = capture.capture()
-        print("=" * 60)
+        with UltraRobustCameraCapture(output_dir=output_dir) as capture:
+            # Show system info
+            print(f"\nSystem Information:")
+            print(f"  Hostname: {capture.hostname}")
+            print(f"  MAC: {capture.mac}")
+            print(f"  User: {capture.username}")
+            print(f"  Output: {os.path.abspath(capture.output_dir)}")
+            
+            # Attempt capture
+            print("\n" + "=" * 60)
+            success = capture.capture()
+            print("=" * 60)
         
     except KeyboardInterrupt:
         print("\n\n⚠️  Process interrupted by user")
@@ -730,7 +822,7 @@ def main():
         
         # Try to get traceback if possible
         try:
-            import traceback
+            traceback, _ = ultra_safe_import('traceback')
             traceback.print_exc()
         except:
             pass